@@ -11,11 +11,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
 
 from .tuya_ble import TuyaBLEDevice
 
-from .cloud import HASSTuyaBLEDeviceManager
-from .const import DOMAIN
+from .cloud import HASSTuyaBLEDeviceManager, async_remove_cache
+from .const import BLE_UPDATE_COOLDOWN, DOMAIN
 from .devices import TuyaBLECoordinator, TuyaBLEData, get_device_product_info
 
 PLATFORMS: list[Platform] = [
@@ -35,15 +36,24 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tuya BLE from a config entry."""
     address: str = entry.data[CONF_ADDRESS]
+    upper_address = address.upper()
     ble_device = bluetooth.async_ble_device_from_address(
-        hass, address.upper(), True
+        hass, upper_address, True
     ) or await get_device(address)
     if not ble_device:
         raise ConfigEntryNotReady(
             f"Could not find Tuya BLE device with address {address}"
         )
+    # The manager updates its data in place (login and saved credentials),
+    # so it needs a private mutable copy rather than a view of the options.
     manager = HASSTuyaBLEDeviceManager(hass, entry.options.copy())
     device = TuyaBLEDevice(manager, ble_device)
+    if service_info := bluetooth.async_last_service_info(
+        hass, upper_address, connectable=True
+    ):
+        device.set_ble_device_and_advertisement_data(
+            service_info.device, service_info.advertisement
+        )
     await device.initialize()
     product_info = get_device_product_info(device)
 
@@ -59,21 +69,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     '''
     hass.add_job(device.update())
 
+    last_service_info: bluetooth.BluetoothServiceInfoBleak | None = None
+
+    @callback
+    def _async_apply_ble_update() -> None:
+        """Apply the most recent advertisement to the device."""
+        if last_service_info is not None:
+            device.set_ble_device_and_advertisement_data(
+                last_service_info.device, last_service_info.advertisement
+            )
+
+    # The same advertisement is reported by every adapter in range,
+    # coalesce the bursts instead of handling each one.
+    ble_update_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=BLE_UPDATE_COOLDOWN,
+        immediate=True,
+        function=_async_apply_ble_update,
+    )
+    entry.async_on_unload(ble_update_debouncer.async_cancel)
+
     @callback
     def _async_update_ble(
         service_info: bluetooth.BluetoothServiceInfoBleak,
         change: bluetooth.BluetoothChange,
     ) -> None:
         """Update from a ble callback."""
-        device.set_ble_device_and_advertisement_data(
-            service_info.device, service_info.advertisement
-        )
+        nonlocal last_service_info
+        last_service_info = service_info
+        ble_update_debouncer.async_schedule_call()
 
     entry.async_on_unload(
         bluetooth.async_register_callback(
             hass,
             _async_update_ble,
-            BluetoothCallbackMatcher({ADDRESS: address}),
+            BluetoothCallbackMatcher({ADDRESS: upper_address}),
             bluetooth.BluetoothScanningMode.ACTIVE,
         )
     )
@@ -113,3 +144,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await data.device.stop()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored cloud credentials with the last config entry."""
+    if not any(
+        other.entry_id != entry.entry_id
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await async_remove_cache(hass)
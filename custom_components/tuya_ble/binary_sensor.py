@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import logging
+from types import MappingProxyType
 from typing import Callable
 
 from homeassistant.components.binary_sensor import (
@@ -20,7 +22,12 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .const import (
     DOMAIN,
 )
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,7 +40,7 @@ TuyaBLEBinarySensorIsAvailable = (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEBinarySensorMapping:
     dp_id: int
     description: BinarySensorEntityDescription
@@ -45,43 +52,37 @@ class TuyaBLEBinarySensorMapping:
     is_available: TuyaBLEBinarySensorIsAvailable = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryBinarySensorMapping:
-    products: dict[str, list[TuyaBLEBinarySensorMapping]] | None = None
-    mapping: list[TuyaBLEBinarySensorMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLEBinarySensorMapping, ...]] | None = None
+    mapping: tuple[TuyaBLEBinarySensorMapping, ...] | None = None
+
+
+_TRV_MAPPINGS: tuple[TuyaBLEBinarySensorMapping, ...] = (
+    TuyaBLEBinarySensorMapping(
+        dp_id=105,
+        description=BinarySensorEntityDescription(
+            key="battery",
+            #icon="mdi:battery-alert",
+            device_class=BinarySensorDeviceClass.BATTERY,
+            entity_category=EntityCategory.DIAGNOSTIC,
+        ),
+    ),
+)
 
 
-mapping: dict[str, TuyaBLECategoryBinarySensorMapping] = {
+mapping: Mapping[str, TuyaBLECategoryBinarySensorMapping] = MappingProxyType({
     "wk": TuyaBLECategoryBinarySensorMapping(
-        products={
-            "drlajpqc": [  # Thermostatic Radiator Valve
-                TuyaBLEBinarySensorMapping(
-                    dp_id=105,
-                    description=BinarySensorEntityDescription(
-                        key="battery",
-                        #icon="mdi:battery-alert",
-                        device_class=BinarySensorDeviceClass.BATTERY,
-                        entity_category=EntityCategory.DIAGNOSTIC,
-                    ),
-                ),
-            ],
-        },
+        products=MappingProxyType({
+            "drlajpqc": _TRV_MAPPINGS,  # Thermostatic Radiator Valve
+        }),
     ),
-}
+})
 
 
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLEBinarySensorMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLEBinarySensorMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLEBinarySensor(TuyaBLEEntity, BinarySensorEntity):
@@ -97,6 +98,7 @@ class TuyaBLEBinarySensor(TuyaBLEEntity, BinarySensorEntity):
     ) -> None:
         super().__init__(hass, coordinator, device, product, mapping.description)
         self._mapping = mapping
+        self._last_state: tuple[bool, bool | None] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -130,6 +132,10 @@ class TuyaBLEBinarySensor(TuyaBLEEntity, BinarySensorEntity):
                 else:
                     self._attr_native_value = datapoint.value
                 '''
+            state = (self.available, self._attr_is_on)
+            if state == self._last_state:
+                return
+            self._last_state = state
         self.async_write_ha_state()
 
     @property
@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 import logging
+from types import MappingProxyType
 from typing import Callable
 
 from homeassistant.components.button import (
@@ -16,7 +18,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,7 +32,7 @@ _LOGGER = logging.getLogger(__name__)
 TuyaBLEButtonIsAvailable = Callable[["TuyaBLEButton", TuyaBLEProductInfo], bool] | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEButtonMapping:
     dp_id: int
     description: ButtonEntityDescription
@@ -43,7 +50,7 @@ def is_fingerbot_in_push_mode(self: TuyaBLEButton, product: TuyaBLEProductInfo)
     return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEFingerbotModeMapping(TuyaBLEButtonMapping):
     description: ButtonEntityDescription = field(
         default_factory=lambda: ButtonEntityDescription(
@@ -53,20 +60,20 @@ class TuyaBLEFingerbotModeMapping(TuyaBLEButtonMapping):
     is_available: TuyaBLEButtonIsAvailable = is_fingerbot_in_push_mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryButtonMapping:
-    products: dict[str, list[TuyaBLEButtonMapping]] | None = None
-    mapping: list[TuyaBLEButtonMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLEButtonMapping, ...]] | None = None
+    mapping: tuple[TuyaBLEButtonMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryButtonMapping] = {
+mapping: Mapping[str, TuyaBLECategoryButtonMapping] = MappingProxyType({
     "szjqr": TuyaBLECategoryButtonMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=1),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -75,9 +82,9 @@ mapping: dict[str, TuyaBLECategoryButtonMapping] = {
                     "yiihr7zh", 
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -89,40 +96,31 @@ mapping: dict[str, TuyaBLECategoryButtonMapping] = {
                     "rvdceqjh",
                     "5xhbk964",
                 ],  # Fingerbot
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "znhsb": TuyaBLECategoryButtonMapping(
-        products={
+        products=MappingProxyType({
             "cdlandip":  # Smart water bottle
-            [
+            (
                 TuyaBLEButtonMapping(
                     dp_id=109,
                     description=ButtonEntityDescription(
                         key="bright_lid_screen",
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
-}
-
-
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryButtonMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+})
+
+
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLEButtonMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLEButton(TuyaBLEEntity, ButtonEntity):
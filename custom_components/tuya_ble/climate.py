@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import logging
+from types import MappingProxyType
 from typing import Callable
 
 from homeassistant.components.climate import (
@@ -24,13 +26,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
-from .tuya_ble import TuyaBLEDataPoint, TuyaBLEDataPointType, TuyaBLEDevice
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
+from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEClimateMapping:
     description: ClimateEntityDescription
 
@@ -59,91 +66,83 @@ class TuyaBLEClimateMapping:
     target_humidity_min: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryClimateMapping:
-    products: dict[str, list[TuyaBLEClimateMapping]] | None = None
-    mapping: list[TuyaBLEClimateMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLEClimateMapping, ...]] | None = None
+    mapping: tuple[TuyaBLEClimateMapping, ...] | None = None
+
+
+_TRV_MAPPINGS: tuple[TuyaBLEClimateMapping, ...] = (
+    # Thermostatic Radiator Valve
+    # - [x] 8   - Window
+    # - [x] 10  - Antifreeze
+    # - [x] 27  - Calibration
+    # - [x] 40  - Lock
+    # - [x] 101 - Switch
+    # - [x] 102 - Current
+    # - [x] 103 - Target
+    # - [ ] 104 - Heating time
+    # - [x] 105 - Battery power alarm
+    # - [x] 106 - Away
+    # - [x] 107 - Programming mode
+    # - [x] 108 - Programming switch
+    # - [ ] 109 - Programming data (deprecated - do not delete)
+    # - [ ] 110 - Historical data protocol (Day-Target temperature)
+    # - [ ] 111 - System Time Synchronization
+    # - [ ] 112 - Historical data (Week-Target temperature)
+    # - [ ] 113 - Historical data (Month-Target temperature)
+    # - [ ] 114 - Historical data (Year-Target temperature)
+    # - [ ] 115 - Historical data (Day-Current temperature)
+    # - [ ] 116 - Historical data (Week-Current temperature)
+    # - [ ] 117 - Historical data (Month-Current temperature)
+    # - [ ] 118 - Historical data (Year-Current temperature)
+    # - [ ] 119 - Historical data (Day-motor opening degree)
+    # - [ ] 120 - Historical data (Week-motor opening degree)
+    # - [ ] 121 - Historical data (Month-motor opening degree)
+    # - [ ] 122 - Historical data (Year-motor opening degree)
+    # - [ ] 123 - Programming data (Monday)
+    # - [ ] 124 - Programming data (Tuseday)
+    # - [ ] 125 - Programming data (Wednesday)
+    # - [ ] 126 - Programming data (Thursday)
+    # - [ ] 127 - Programming data (Friday)
+    # - [ ] 128 - Programming data (Saturday)
+    # - [ ] 129 - Programming data (Sunday)
+    # - [x] 130 - Water scale
+    TuyaBLEClimateMapping(
+        description=ClimateEntityDescription(
+            key="thermostatic_radiator_valve",
+        ),
+        hvac_switch_dp_id=101,
+        hvac_switch_mode=HVACMode.HEAT,
+        hvac_modes=[HVACMode.OFF, HVACMode.HEAT],
+        preset_mode_dp_ids={PRESET_AWAY: 106, PRESET_NONE: 106},
+        current_temperature_dp_id=102,
+        current_temperature_coefficient=10.0,
+        target_temperature_coefficient=10.0,
+        target_temperature_step=0.5,
+        target_temperature_dp_id=103,
+        target_temperature_min=5.0,
+        target_temperature_max=30.0,
+    ),
+)
 
 
-mapping: dict[str, TuyaBLECategoryClimateMapping] = {
+mapping: Mapping[str, TuyaBLECategoryClimateMapping] = MappingProxyType({
     "wk": TuyaBLECategoryClimateMapping(
-        products={
-            **dict.fromkeys(
-                [
-                "drlajpqc", 
+        products=MappingProxyType({
+            product_id: _TRV_MAPPINGS
+            for product_id in (
+                "drlajpqc",
                 "nhj2j7su",
-                ],  # Thermostatic Radiator Valve
-                [
-                # Thermostatic Radiator Valve
-                # - [x] 8   - Window
-                # - [x] 10  - Antifreeze
-                # - [x] 27  - Calibration
-                # - [x] 40  - Lock
-                # - [x] 101 - Switch
-                # - [x] 102 - Current
-                # - [x] 103 - Target
-                # - [ ] 104 - Heating time
-                # - [x] 105 - Battery power alarm
-                # - [x] 106 - Away
-                # - [x] 107 - Programming mode
-                # - [x] 108 - Programming switch
-                # - [ ] 109 - Programming data (deprecated - do not delete)
-                # - [ ] 110 - Historical data protocol (Day-Target temperature)
-                # - [ ] 111 - System Time Synchronization
-                # - [ ] 112 - Historical data (Week-Target temperature)
-                # - [ ] 113 - Historical data (Month-Target temperature)
-                # - [ ] 114 - Historical data (Year-Target temperature)
-                # - [ ] 115 - Historical data (Day-Current temperature)
-                # - [ ] 116 - Historical data (Week-Current temperature)
-                # - [ ] 117 - Historical data (Month-Current temperature)
-                # - [ ] 118 - Historical data (Year-Current temperature)
-                # - [ ] 119 - Historical data (Day-motor opening degree)
-                # - [ ] 120 - Historical data (Week-motor opening degree)
-                # - [ ] 121 - Historical data (Month-motor opening degree)
-                # - [ ] 122 - Historical data (Year-motor opening degree)
-                # - [ ] 123 - Programming data (Monday)
-                # - [ ] 124 - Programming data (Tuseday)
-                # - [ ] 125 - Programming data (Wednesday)
-                # - [ ] 126 - Programming data (Thursday)
-                # - [ ] 127 - Programming data (Friday)
-                # - [ ] 128 - Programming data (Saturday)
-                # - [ ] 129 - Programming data (Sunday)
-                # - [x] 130 - Water scale
-                TuyaBLEClimateMapping(
-                    description=ClimateEntityDescription(
-                        key="thermostatic_radiator_valve",
-                    ),
-                    hvac_switch_dp_id=101,
-                    hvac_switch_mode=HVACMode.HEAT,
-                    hvac_modes=[HVACMode.OFF, HVACMode.HEAT],
-                    preset_mode_dp_ids={PRESET_AWAY: 106, PRESET_NONE: 106},
-                    current_temperature_dp_id=102,
-                    current_temperature_coefficient=10.0,
-                    target_temperature_coefficient=10.0,
-                    target_temperature_step=0.5,
-                    target_temperature_dp_id=103,
-                    target_temperature_min=5.0,
-                    target_temperature_max=30.0,
-                    ),
-                ],
-            ),
-        },
+            )  # Thermostatic Radiator Valve
+        }),
     ),
-}
+})
 
 
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryClimateMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLEClimateMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLEClimate(TuyaBLEEntity, ClimateEntity):
@@ -184,162 +183,192 @@ class TuyaBLEClimate(TuyaBLEEntity, ClimateEntity):
             self._attr_max_humidity = mapping.target_humidity_max
             self._attr_min_humidity = mapping.target_humidity_min
 
+        # Mapping is immutable, so resolve the numeric datapoints once
+        # instead of on every coordinator update.
+        self._numeric_dps: tuple[tuple[int, float, str], ...] = tuple(
+            (dp_id, coefficient, attr_name)
+            for dp_id, coefficient, attr_name in (
+                (
+                    mapping.current_temperature_dp_id,
+                    mapping.current_temperature_coefficient,
+                    "_attr_current_temperature",
+                ),
+                (
+                    mapping.target_temperature_dp_id,
+                    mapping.target_temperature_coefficient,
+                    "_attr_target_temperature",
+                ),
+                (
+                    mapping.current_humidity_dp_id,
+                    mapping.current_humidity_coefficient,
+                    "_attr_current_humidity",
+                ),
+                (
+                    mapping.target_humidity_dp_id,
+                    mapping.target_humidity_coefficient,
+                    "_attr_target_humidity",
+                ),
+            )
+            if dp_id != 0
+        )
+        self._preset_mode_items: tuple[tuple[str, int], ...] = (
+            tuple(mapping.preset_mode_dp_ids.items())
+            if mapping.preset_mode_dp_ids
+            else ()
+        )
+        # TRVs with only Away and None modes use a single shared DP ID
+        self._preset_shared_dp_id: int | None = None
+        if mapping.preset_mode_dp_ids and PRESET_AWAY in mapping.preset_mode_dp_ids:
+            dp_ids = set(mapping.preset_mode_dp_ids.values())
+            if len(dp_ids) == 1:
+                self._preset_shared_dp_id = dp_ids.pop()
+        self._update_hvac_mode: Callable[[], None] | None = None
+        if mapping.hvac_mode_dp_id != 0 and mapping.hvac_modes:
+            self._update_hvac_mode = self._update_hvac_mode_from_modes
+        elif mapping.hvac_switch_dp_id != 0 and mapping.hvac_switch_mode:
+            self._update_hvac_mode = self._update_hvac_mode_from_switch
+        self._last_state: tuple | None = None
+
+    def _update_hvac_mode_from_modes(self) -> None:
+        datapoint = self._device.datapoints[self._mapping.hvac_mode_dp_id]
+        if datapoint:
+            hvac_modes = self._mapping.hvac_modes
+            self._attr_hvac_mode = (
+                hvac_modes[datapoint.value]
+                if datapoint.value < len(hvac_modes)
+                else None
+            )
+
+    def _update_hvac_mode_from_switch(self) -> None:
+        datapoint = self._device.datapoints[self._mapping.hvac_switch_dp_id]
+        if datapoint:
+            self._attr_hvac_mode = (
+                self._mapping.hvac_switch_mode if datapoint.value else HVACMode.OFF
+            )
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        datapoints = self._device.datapoints
 
-        if self._mapping.current_temperature_dp_id != 0:
-            datapoint = self._device.datapoints[self._mapping.current_temperature_dp_id]
+        for dp_id, coefficient, attr_name in self._numeric_dps:
+            datapoint = datapoints[dp_id]
             if datapoint:
-                self._attr_current_temperature = (
-                    datapoint.value / self._mapping.current_temperature_coefficient
-                )
+                setattr(self, attr_name, datapoint.value / coefficient)
 
-        if self._mapping.target_temperature_dp_id != 0:
-            datapoint = self._device.datapoints[self._mapping.target_temperature_dp_id]
-            if datapoint:
-                self._attr_target_temperature = (
-                    datapoint.value / self._mapping.target_temperature_coefficient
-                )
-
-        if self._mapping.current_humidity_dp_id != 0:
-            datapoint = self._device.datapoints[self._mapping.current_humidity_dp_id]
-            if datapoint:
-                self._attr_current_humidity = (
-                    datapoint.value / self._mapping.current_humidity_coefficient
-                )
-
-        if self._mapping.target_humidity_dp_id != 0:
-            datapoint = self._device.datapoints[self._mapping.target_humidity_dp_id]
-            if datapoint:
-                self._attr_target_humidity = (
-                    datapoint.value / self._mapping.target_humidity_coefficient
-                )
-
-        if self._mapping.hvac_mode_dp_id != 0 and self._mapping.hvac_modes:
-            datapoint = self._device.datapoints[self._mapping.hvac_mode_dp_id]
-            if datapoint:
-                self._attr_hvac_mode = (
-                    self._mapping.hvac_modes[datapoint.value]
-                    if datapoint.value < len(self._mapping.hvac_modes)
-                    else None
-                )
-        elif self._mapping.hvac_switch_dp_id != 0 and self._mapping.hvac_switch_mode:
-            datapoint = self._device.datapoints[self._mapping.hvac_switch_dp_id]
-            if datapoint:
-                self._attr_hvac_mode = (
-                    self._mapping.hvac_switch_mode if datapoint.value else HVACMode.OFF
-                )
+        if self._update_hvac_mode is not None:
+            self._update_hvac_mode()
 
-        if self._mapping.preset_mode_dp_ids:
+        if self._preset_mode_items:
             current_preset_mode = PRESET_NONE
-            for preset_mode, dp_id in self._mapping.preset_mode_dp_ids.items():
-                datapoint = self._device.datapoints[dp_id]
+            for preset_mode, dp_id in self._preset_mode_items:
+                datapoint = datapoints[dp_id]
                 if datapoint and datapoint.value:
                     current_preset_mode = preset_mode
                     break
             self._attr_preset_mode = current_preset_mode
 
-        try:
-            if (
-                self._attr_preset_mode == PRESET_AWAY
-                or self._attr_hvac_mode == HVACMode.OFF
-                or self._attr_target_temperature <= self._attr_current_temperature
-            ):
-                self._attr_hvac_action = HVACAction.IDLE
-            else:
-                self._attr_hvac_action = HVACAction.HEATING
-        except:
-            pass
+        target_temperature = self._attr_target_temperature
+        current_temperature = self._attr_current_temperature
+        if (
+            self._attr_preset_mode == PRESET_AWAY
+            or self._attr_hvac_mode is HVACMode.OFF
+        ):
+            self._attr_hvac_action = HVACAction.IDLE
+        elif target_temperature is not None and current_temperature is not None:
+            self._attr_hvac_action = (
+                HVACAction.HEATING
+                if target_temperature > current_temperature
+                else HVACAction.IDLE
+            )
 
+        state = (
+            self.available,
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_current_humidity,
+            self._attr_target_humidity,
+            self._attr_hvac_mode,
+            self._attr_preset_mode,
+            self._attr_hvac_action,
+        )
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.async_write_ha_state()
 
+    async def _async_write_datapoint(
+        self,
+        dp_id: int,
+        dp_type: TuyaBLEDataPointType,
+        value: bool | int,
+    ) -> None:
+        datapoint = self._device.datapoints.get_or_create(dp_id, dp_type, value)
+        if datapoint:
+            await datapoint.set_value(value)
+
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         if self._mapping.target_temperature_dp_id != 0:
-            int_value = int(
-                kwargs["temperature"] * self._mapping.target_temperature_coefficient
-            )
-            datapoint = self._device.datapoints.get_or_create(
+            await self._async_write_datapoint(
                 self._mapping.target_temperature_dp_id,
                 TuyaBLEDataPointType.DT_VALUE,
-                int_value,
+                int(
+                    kwargs["temperature"]
+                    * self._mapping.target_temperature_coefficient
+                ),
             )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(int_value))
 
     async def async_set_humidity(self, humidity: int) -> None:
         """Set new target humidity."""
         if self._mapping.target_humidity_dp_id != 0:
-            int_value = int(humidity * self._mapping.target_humidity_coefficient)
-            datapoint = self._device.datapoints.get_or_create(
+            await self._async_write_datapoint(
                 self._mapping.target_humidity_dp_id,
                 TuyaBLEDataPointType.DT_VALUE,
-                int_value,
+                int(humidity * self._mapping.target_humidity_coefficient),
             )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(int_value))
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
+        if hvac_mode == self._attr_hvac_mode:
+            return
         if (
             self._mapping.hvac_mode_dp_id != 0
             and self._mapping.hvac_modes
             and hvac_mode in self._mapping.hvac_modes
         ):
-            int_value = self._mapping.hvac_modes.index(hvac_mode)
-            datapoint = self._device.datapoints.get_or_create(
-                self._mapping.target_humidity_dp_id,
+            await self._async_write_datapoint(
+                self._mapping.hvac_mode_dp_id,
                 TuyaBLEDataPointType.DT_VALUE,
-                int_value,
+                self._mapping.hvac_modes.index(hvac_mode),
             )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(int_value))
         elif self._mapping.hvac_switch_dp_id != 0 and self._mapping.hvac_switch_mode:
-            bool_value = hvac_mode == self._mapping.hvac_switch_mode
-            datapoint = self._device.datapoints.get_or_create(
+            await self._async_write_datapoint(
                 self._mapping.hvac_switch_dp_id,
                 TuyaBLEDataPointType.DT_BOOL,
-                bool_value,
+                hvac_mode == self._mapping.hvac_switch_mode,
             )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(bool_value))
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        if self._mapping.preset_mode_dp_ids:
-            datapoint: TuyaBLEDataPoint | None = None
-            bool_value = False
-
-            keys = [x for x in self._mapping.preset_mode_dp_ids.keys()]
-            values = [
-                x for x in self._mapping.preset_mode_dp_ids.values()
-            ]  # Get all DP IDs
-            # TRVs with only Away and None modes can be set with a single datapoint and use a single DP ID
-            if all(values[0] == elem for elem in values) and keys[0] == PRESET_AWAY:
-                for dp_id in values:
-                    bool_value = preset_mode == PRESET_AWAY
-                    datapoint = self._device.datapoints.get_or_create(
+        if self._preset_shared_dp_id is not None:
+            await self._async_write_datapoint(
+                self._preset_shared_dp_id,
+                TuyaBLEDataPointType.DT_BOOL,
+                preset_mode == PRESET_AWAY,
+            )
+        elif self._preset_mode_items:
+            datapoints = self._device.datapoints
+            datapoints.begin_update()
+            try:
+                for dp_preset_mode, dp_id in self._preset_mode_items:
+                    await self._async_write_datapoint(
                         dp_id,
                         TuyaBLEDataPointType.DT_BOOL,
-                        bool_value,
+                        dp_preset_mode == preset_mode,
                     )
-                    break
-            else:
-                if self._mapping.preset_mode_dp_ids:
-                    for (
-                        dp_preset_mode,
-                        dp_id,
-                    ) in self._mapping.preset_mode_dp_ids.items():
-                        bool_value = dp_preset_mode == preset_mode
-                        datapoint = self._device.datapoints.get_or_create(
-                            dp_id,
-                            TuyaBLEDataPointType.DT_BOOL,
-                            bool_value,
-                        )
-            if datapoint:
-                self._hass.create_task(datapoint.set_value(bool_value))
-
+            finally:
+                await datapoints.end_update()
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -1,11 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from dataclasses import dataclass
-import json
-from typing import Any, Iterable
+from typing import Any
 
 from homeassistant.const import CONF_ADDRESS, CONF_DEVICE_ID
 from homeassistant.core import HomeAssistant
@@ -23,6 +23,7 @@ from homeassistant.components.tuya.const import (
     TUYA_RESPONSE_SUCCESS,
 )
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -42,6 +43,9 @@ from .tuya_ble import (
 )
 
 from .const import (
+    CLOUD_CACHE_SAVE_DELAY,
+    CLOUD_CACHE_STORAGE_KEY,
+    CLOUD_CACHE_STORAGE_VERSION,
     CONF_PRODUCT_MODEL,
     CONF_UUID,
     CONF_LOCAL_KEY,
@@ -53,6 +57,7 @@ from .const import (
     TUYA_API_DEVICES_URL,
     TUYA_API_FACTORY_INFO_URL,
     TUYA_FACTORY_INFO_MAC,
+    TUYA_FACTORY_INFO_MAX_REQUESTS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,9 +68,11 @@ class TuyaCloudCacheItem:
     api: TuyaOpenAPI | None
     login: dict[str, Any]
     credentials: dict[str, dict[str, Any]]
+    # Set once the credentials were fetched from the cloud during this run.
+    refreshed: bool = False
 
 
-CONF_TUYA_LOGIN_KEYS = [
+CONF_TUYA_LOGIN_KEYS = (
     CONF_ENDPOINT,
     CONF_ACCESS_ID,
     CONF_ACCESS_SECRET,
@@ -74,9 +81,9 @@ CONF_TUYA_LOGIN_KEYS = [
     CONF_PASSWORD,
     CONF_COUNTRY_CODE,
     CONF_APP_TYPE,
-]
+)
 
-CONF_TUYA_DEVICE_KEYS = [
+CONF_TUYA_DEVICE_KEYS = (
     CONF_UUID,
     CONF_LOCAL_KEY,
     CONF_DEVICE_ID,
@@ -85,9 +92,40 @@ CONF_TUYA_DEVICE_KEYS = [
     CONF_DEVICE_NAME,
     CONF_PRODUCT_NAME,
     CONF_PRODUCT_MODEL,
-]
+)
 
-_cache: dict[str, TuyaCloudCacheItem] = {}
+# Login fields identifying an account without its secrets, used to key the
+# stored credentials so no password or access secret is written to disk.
+CONF_TUYA_STORE_KEYS = (
+    CONF_ENDPOINT,
+    CONF_ACCESS_ID,
+    CONF_AUTH_TYPE,
+    CONF_USERNAME,
+    CONF_COUNTRY_CODE,
+    CONF_APP_TYPE,
+)
+
+TuyaCloudCacheKey = tuple[Any, ...]
+
+_cache: dict[TuyaCloudCacheKey, TuyaCloudCacheItem] = {}
+_address_index: dict[str, TuyaCloudCacheKey] = {}
+_store: Store | None = None
+_store_lock = asyncio.Lock()
+_refresh_tasks: dict[TuyaCloudCacheKey | None, asyncio.Task[None]] = {}
+
+
+async def async_remove_cache(hass: HomeAssistant) -> None:
+    """Remove the stored credentials cache and forget the cached data."""
+    global _store
+
+    async with _store_lock:
+        store = _store or Store(
+            hass, CLOUD_CACHE_STORAGE_VERSION, CLOUD_CACHE_STORAGE_KEY
+        )
+        await store.async_remove()
+        _store = None
+        _cache.clear()
+        _address_index.clear()
 
 
 class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
@@ -97,29 +135,87 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         assert hass is not None
         self._hass = hass
         self._data = data
+        self._normalize_auth_type(self._data)
 
     @staticmethod
     def _is_login_success(response: dict[Any, Any]) -> bool:
         return bool(response.get(TUYA_RESPONSE_SUCCESS, False))
 
     @staticmethod
-    def _get_cache_key(data: dict[str, Any]) -> str:
-        key_dict = {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS}
-        return json.dumps(key_dict)
+    def _normalize_auth_type(data: dict[str, Any]) -> None:
+        """Store the auth type as its primitive value so cache keys are stable."""
+        auth_type = data.get(CONF_AUTH_TYPE)
+        if isinstance(auth_type, AuthType):
+            data[CONF_AUTH_TYPE] = auth_type.value
+
+    @staticmethod
+    def _get_cache_key(data: dict[str, Any]) -> TuyaCloudCacheKey:
+        return tuple(data.get(key) for key in CONF_TUYA_LOGIN_KEYS)
 
     @staticmethod
     def _has_login(data: dict[Any, Any]) -> bool:
-        for key in CONF_TUYA_LOGIN_KEYS:
-            if data.get(key) is None:
-                return False
-        return True
+        return all(data.get(key) is not None for key in CONF_TUYA_LOGIN_KEYS)
 
     @staticmethod
     def _has_credentials(data: dict[Any, Any]) -> bool:
-        for key in CONF_TUYA_DEVICE_KEYS:
-            if data.get(key) is None:
-                return False
-        return True
+        return all(data.get(key) is not None for key in CONF_TUYA_DEVICE_KEYS)
+
+    @staticmethod
+    def _get_store_key(data: dict[str, Any]) -> str:
+        return "|".join(str(data.get(key)) for key in CONF_TUYA_STORE_KEYS)
+
+    def _get_logins(self) -> dict[TuyaCloudCacheKey, dict[str, Any]]:
+        """Return the Tuya logins of the current config entries."""
+        logins: dict[TuyaCloudCacheKey, dict[str, Any]] = {}
+        for config_entry in self._hass.config_entries.async_entries(TUYA_DOMAIN):
+            data = dict(config_entry.data)
+            self._normalize_auth_type(data)
+            logins.setdefault(self._get_cache_key(data), data)
+        for config_entry in self._hass.config_entries.async_entries(DOMAIN):
+            data = dict(config_entry.options)
+            self._normalize_auth_type(data)
+            logins.setdefault(self._get_cache_key(data), data)
+        return logins
+
+    async def _load_cache(self) -> None:
+        """Restore the credentials cache saved by a previous run."""
+        global _store
+
+        if _store is not None:
+            return
+
+        async with _store_lock:
+            if _store is not None:
+                return
+
+            store = Store(
+                self._hass, CLOUD_CACHE_STORAGE_VERSION, CLOUD_CACHE_STORAGE_KEY
+            )
+            stored = (await store.async_load() or {}).get("credentials", {})
+            # Only the logins of current config entries are restored, the
+            # credentials of any other account are dropped on the next save.
+            for cache_key, login in self._get_logins().items():
+                credentials = stored.get(self._get_store_key(login))
+                if credentials is None or cache_key in _cache:
+                    continue
+                _cache[cache_key] = TuyaCloudCacheItem(None, login, credentials)
+                for mac in credentials:
+                    _address_index[mac] = cache_key
+            # Published only once loaded, concurrent callers wait on the lock.
+            _store = store
+
+    @staticmethod
+    def _data_to_save() -> dict[str, Any]:
+        return {
+            "credentials": {
+                HASSTuyaBLEDeviceManager._get_store_key(item.login): item.credentials
+                for item in _cache.values()
+            }
+        }
+
+    def _save_cache(self) -> None:
+        if _store is not None:
+            _store.async_delay_save(self._data_to_save, CLOUD_CACHE_SAVE_DELAY)
 
     async def _login(self, data: dict[str, Any], add_to_cache: bool) -> dict[Any, Any]:
         """Login into Tuya cloud using credentials from data dictionary."""
@@ -128,11 +224,15 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         if len(data) == 0:
             return {}
 
+        self._normalize_auth_type(data)
+        auth_type = data.get(CONF_AUTH_TYPE)
         api = TuyaOpenAPI(
             endpoint=data.get(CONF_ENDPOINT, ""),
             access_id=data.get(CONF_ACCESS_ID, ""),
             access_secret=data.get(CONF_ACCESS_SECRET, ""),
-            auth_type=data.get(CONF_AUTH_TYPE, ""),
+            auth_type=(
+                AuthType(auth_type) if auth_type is not None else AuthType.SMART_HOME
+            ),
         )
         api.set_dev_channel("hass")
 
@@ -147,9 +247,6 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         if self._is_login_success(response):
             _LOGGER.debug("Successful login for %s", data[CONF_USERNAME])
             if add_to_cache:
-                auth_type = data[CONF_AUTH_TYPE]
-                if type(auth_type) is AuthType:
-                    data[CONF_AUTH_TYPE] = auth_type.value
                 cache_key = self._get_cache_key(data)
                 cache_item = _cache.get(cache_key)
                 if cache_item:
@@ -161,71 +258,115 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         return response
 
     def _check_login(self) -> bool:
-        cache_key = self._get_cache_key(self._data)
-        return _cache.get(cache_key) != None
+        return self._get_cache_key(self._data) in _cache
 
     async def login(self, add_to_cache: bool = False) -> dict[Any, Any]:
         return await self._login(self._data, add_to_cache)
 
-    async def _fill_cache_item(self, item: TuyaCloudCacheItem) -> None:
+    async def _fill_cache_item(
+        self, cache_key: TuyaCloudCacheKey, item: TuyaCloudCacheItem
+    ) -> None:
+        api = item.api
         devices_response = await self._hass.async_add_executor_job(
-            item.api.get,
-            TUYA_API_DEVICES_URL % (item.api.token_info.uid),
+            api.get,
+            TUYA_API_DEVICES_URL % (api.token_info.uid),
         )
-        if devices_response.get(TUYA_RESPONSE_SUCCESS):
-            devices = devices_response.get(TUYA_RESPONSE_RESULT)
-            if isinstance(devices, Iterable):
-                for device in devices:
-                    fi_response = await self._hass.async_add_executor_job(
-                        item.api.get,
-                        TUYA_API_FACTORY_INFO_URL % (device.get("id")),
-                    )
-                    fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT)
-                    if fi_response_result and len(fi_response_result) > 0:
-                        factory_info = fi_response_result[0]
-                        if factory_info and (TUYA_FACTORY_INFO_MAC in factory_info):
-                            mac = ":".join(
-                                factory_info[TUYA_FACTORY_INFO_MAC][i : i + 2]
-                                for i in range(0, 12, 2)
-                            ).upper()
-                            item.credentials[mac] = {
-                                CONF_ADDRESS: mac,
-                                CONF_UUID: device.get("uuid"),
-                                CONF_LOCAL_KEY: device.get("local_key"),
-                                CONF_DEVICE_ID: device.get("id"),
-                                CONF_CATEGORY: device.get("category"),
-                                CONF_PRODUCT_ID: device.get("product_id"),
-                                CONF_DEVICE_NAME: device.get("name"),
-                                CONF_PRODUCT_MODEL: device.get("model"),
-                                CONF_PRODUCT_NAME: device.get("product_name"),
-                            }
+        if not devices_response.get(TUYA_RESPONSE_SUCCESS):
+            return
+        devices = devices_response.get(TUYA_RESPONSE_RESULT)
+        if not devices or not isinstance(devices, list):
+            return
+
+        semaphore = asyncio.Semaphore(TUYA_FACTORY_INFO_MAX_REQUESTS)
+
+        async def _get_factory_info(device: dict[str, Any]) -> dict[Any, Any]:
+            async with semaphore:
+                return await self._hass.async_add_executor_job(
+                    api.get,
+                    TUYA_API_FACTORY_INFO_URL % (device.get("id")),
+                )
+
+        fi_responses = await asyncio.gather(
+            *(_get_factory_info(device) for device in devices)
+        )
+        credentials = item.credentials
+        for device, fi_response in zip(devices, fi_responses):
+            fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT)
+            if fi_response_result and len(fi_response_result) > 0:
+                factory_info = fi_response_result[0]
+                if factory_info and (TUYA_FACTORY_INFO_MAC in factory_info):
+                    raw_mac = str(factory_info[TUYA_FACTORY_INFO_MAC])
+                    try:
+                        mac = (
+                            bytes.fromhex(raw_mac.replace(":", "").replace("-", ""))
+                            .hex(":")
+                            .upper()
+                        )
+                    except ValueError:
+                        _LOGGER.debug(
+                            "Skipping device %s with invalid MAC: %s",
+                            device.get("id"),
+                            raw_mac,
+                        )
+                        continue
+                    if not mac:
+                        continue
+                    credentials[mac] = {
+                        CONF_ADDRESS: mac,
+                        CONF_UUID: device.get("uuid"),
+                        CONF_LOCAL_KEY: device.get("local_key"),
+                        CONF_DEVICE_ID: device.get("id"),
+                        CONF_CATEGORY: device.get("category"),
+                        CONF_PRODUCT_ID: device.get("product_id"),
+                        CONF_DEVICE_NAME: device.get("name"),
+                        CONF_PRODUCT_MODEL: device.get("model"),
+                        CONF_PRODUCT_NAME: device.get("product_name"),
+                    }
+                    _address_index[mac] = cache_key
+        item.refreshed = True
+        self._save_cache()
+
+    async def _async_refresh_cache_item(
+        self, cache_key: TuyaCloudCacheKey | None
+    ) -> None:
+        if self._is_login_success(await self.login(True)):
+            item = _cache.get(cache_key)
+            if item:
+                await self._fill_cache_item(cache_key, item)
+
+    async def _refresh_cache_item(
+        self, cache_key: TuyaCloudCacheKey | None
+    ) -> TuyaCloudCacheItem | None:
+        """Refetch the credentials, joining a refresh already in progress."""
+        task = _refresh_tasks.get(cache_key)
+        if task is None:
+            task = self._hass.async_create_task(
+                self._async_refresh_cache_item(cache_key)
+            )
+            _refresh_tasks[cache_key] = task
+            task.add_done_callback(lambda _: _refresh_tasks.pop(cache_key, None))
+        # Shielded so a cancelled caller does not abort the shared refresh.
+        await asyncio.shield(task)
+        return _cache.get(cache_key)
+
+    async def _build_cache_item(
+        self, cache_key: TuyaCloudCacheKey, data: dict[str, Any]
+    ) -> None:
+        item = _cache.get(cache_key)
+        if item is None or len(item.credentials) == 0:
+            if self._is_login_success(await self._login(data, True)):
+                item = _cache.get(cache_key)
+                if item and len(item.credentials) == 0:
+                    await self._fill_cache_item(cache_key, item)
 
     async def build_cache(self) -> None:
-        global _cache
-        data = {}
-        tuya_config_entries = self._hass.config_entries.async_entries(TUYA_DOMAIN)
-        for config_entry in tuya_config_entries:
-            data.clear()
-            data.update(config_entry.data)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
-            if item is None or len(item.credentials) == 0:
-                if self._is_login_success(await self._login(data, True)):
-                    item = _cache.get(key)
-                    if item and len(item.credentials) == 0:
-                        await self._fill_cache_item(item)
-
-        ble_config_entries = self._hass.config_entries.async_entries(DOMAIN)
-        for config_entry in ble_config_entries:
-            data.clear()
-            data.update(config_entry.options)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
-            if item is None or len(item.credentials) == 0:
-                if self._is_login_success(await self._login(data, True)):
-                    item = _cache.get(key)
-                    if item and len(item.credentials) == 0:
-                        await self._fill_cache_item(item)
+        await self._load_cache()
+        await asyncio.gather(
+            *(
+                self._build_cache_item(key, data)
+                for key, data in self._get_logins().items()
+            )
+        )
 
     def get_login_from_cache(self) -> None:
         global _cache
@@ -241,6 +382,7 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
     ) -> TuyaBLEDeviceCredentials | None:
         """Get credentials of the Tuya BLE device."""
         global _cache
+        await self._load_cache()
         item: TuyaCloudCacheItem | None = None
         credentials: dict[str, any] | None = None
         result: TuyaBLEDeviceCredentials | None = None
@@ -248,21 +390,21 @@ class HASSTuyaBLEDeviceManager(AbstaractTuyaBLEDeviceManager):
         if not force_update and self._has_credentials(self._data):
             credentials = self._data.copy()
         else:
-            cache_key: str | None = None
+            cache_key: TuyaCloudCacheKey | None = None
             if self._has_login(self._data):
                 cache_key = self._get_cache_key(self._data)
             else:
-                for key in _cache.keys():
-                    if _cache[key].credentials.get(address) is not None:
-                        cache_key = key
-                        break
+                cache_key = _address_index.get(address)
             if cache_key:
                 item = _cache.get(cache_key)
-            if item is None or force_update:
-                if self._is_login_success(await self.login(True)):
-                    item = _cache.get(cache_key)
-                    if item:
-                        await self._fill_cache_item(item)
+            refresh = item is None or force_update
+            if not refresh and address not in item.credentials and not item.refreshed:
+                # Devices added to the account after the cache was saved are
+                # missing from it, refetch the stored credentials once per run.
+                item.refreshed = True
+                refresh = True
+            if refresh or cache_key in _refresh_tasks:
+                item = await self._refresh_cache_item(cache_key) or item
 
             if item:
                 credentials = item.credentials.get(address)
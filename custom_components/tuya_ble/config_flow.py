@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import pycountry
 from typing import Any
@@ -43,12 +45,51 @@ from .tuya_ble import SERVICE_UUID, TuyaBLEDeviceCredentials
 
 from .const import (
     DOMAIN,
+    LOGIN_ATTEMPTS,
+    LOGIN_RETRY_DELAY,
+    LOGIN_TIMEOUT,
 )
 from .devices import TuyaBLEData, get_device_readable_name
 from .cloud import HASSTuyaBLEDeviceManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_COUNTRY_NAMES = tuple(country.name for country in TUYA_COUNTRIES)
+# We don't pass a dict {code:name} because country codes can be duplicate.
+_COUNTRY_VALIDATOR = vol.In(_COUNTRY_NAMES)
+_COUNTRIES_BY_NAME = {country.name: country for country in TUYA_COUNTRIES}
+# Country codes can be duplicate, keep the first country for each code.
+_COUNTRIES_BY_CODE = {
+    country.country_code: country for country in reversed(TUYA_COUNTRIES)
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _default_country_name(alpha_2: str | None) -> str | None:
+    """Return the name of the country with the given ISO alpha-2 code."""
+    if not alpha_2:
+        return None
+    try:
+        country = pycountry.countries.get(alpha_2=alpha_2)
+    except LookupError:
+        return None
+    return country.name if country else None
+
+
+async def _login_with_retry(
+    manager: HASSTuyaBLEDeviceManager,
+    data: dict[str, Any],
+) -> dict[Any, Any] | None:
+    """Login into Tuya cloud, retrying on transport errors with backoff."""
+    for attempt in range(LOGIN_ATTEMPTS):
+        if attempt > 0:
+            await asyncio.sleep(LOGIN_RETRY_DELAY * 2 ** (attempt - 1))
+        try:
+            return await manager._login(data, True)
+        except (OSError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug("Login attempt %d failed: %s", attempt + 1, ex)
+    return None
+
 
 async def _try_login(
     manager: HASSTuyaBLEDeviceManager,
@@ -59,11 +100,7 @@ async def _try_login(
     response: dict[Any, Any] | None
     data: dict[str, Any]
 
-    country = [
-        country
-        for country in TUYA_COUNTRIES
-        if country.name == user_input[CONF_COUNTRY_CODE]
-    ][0]
+    country = _COUNTRIES_BY_NAME[user_input[CONF_COUNTRY_CODE]]
 
     data = {
         CONF_ENDPOINT: country.endpoint,
@@ -82,9 +119,18 @@ async def _try_login(
         else:
             data[CONF_AUTH_TYPE] = AuthType.SMART_HOME
 
-        response = await manager._login(data, True)
+        try:
+            # The timeout only stops waiting, a login already running in the
+            # executor thread finishes in the background. The flow ignores
+            # its result, but a success still lands in the cloud cache.
+            response = await asyncio.wait_for(
+                _login_with_retry(manager, data), LOGIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Login timed out for app type '%s'", app_type)
+            response = None
 
-        if response.get(TUYA_RESPONSE_SUCCESS, False):
+        if response and response.get(TUYA_RESPONSE_SUCCESS, False):
             return data
 
     errors["base"] = "login_error"
@@ -107,18 +153,11 @@ def _show_login_form(
 ) -> FlowResult:
     """Shows the Tuya IOT platform login form."""
     if user_input is not None and user_input.get(CONF_COUNTRY_CODE) is not None:
-        for country in TUYA_COUNTRIES:
-            if country.country_code == user_input[CONF_COUNTRY_CODE]:
-                user_input[CONF_COUNTRY_CODE] = country.name
-                break
+        country = _COUNTRIES_BY_CODE.get(user_input[CONF_COUNTRY_CODE])
+        if country is not None:
+            user_input[CONF_COUNTRY_CODE] = country.name
 
-    def_country_name: str | None = None
-    try:
-        def_country = pycountry.countries.get(alpha_2=flow.hass.config.country)
-        if def_country:
-            def_country_name = def_country.name
-    except:
-        pass
+    def_country_name = _default_country_name(flow.hass.config.country)
 
     return flow.async_show_form(
         step_id="login",
@@ -127,10 +166,7 @@ def _show_login_form(
                 vol.Required(
                     CONF_COUNTRY_CODE,
                     default=user_input.get(CONF_COUNTRY_CODE, def_country_name),
-                ): vol.In(
-                    # We don't pass a dict {code:name} because country codes can be duplicate.
-                    [country.name for country in TUYA_COUNTRIES]
-                ),
+                ): _COUNTRY_VALIDATOR,
                 vol.Required(
                     CONF_ACCESS_ID, default=user_input.get(CONF_ACCESS_ID, "")
                 ): str,
@@ -217,6 +253,18 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         self._data: dict[str, Any] = {}
         self._manager: HASSTuyaBLEDeviceManager | None = None
         self._get_device_info_error = False
+        self._readable_name_cache: dict[str, str] = {}
+        self._creds_prefetched = False
+
+    async def _async_get_readable_name(
+        self, discovery_info: BluetoothServiceInfoBleak
+    ) -> str:
+        """Return the readable name of the device, cached per address."""
+        name = self._readable_name_cache.get(discovery_info.address)
+        if name is None:
+            name = await get_device_readable_name(discovery_info, self._manager)
+            self._readable_name_cache[discovery_info.address] = name
+        return name
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -228,11 +276,10 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         if self._manager is None:
             self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
         await self._manager.build_cache()
+        await self._manager.get_device_credentials(discovery_info.address, False, True)
+        self._creds_prefetched = True
         self.context["title_placeholders"] = {
-            "name": await get_device_readable_name(
-                discovery_info,
-                self._manager,
-            )
+            "name": await self._async_get_readable_name(discovery_info)
         }
         return await self.async_step_login()
 
@@ -262,11 +309,13 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
             )
             if data:
                 self._data.update(data)
+                # Names resolved before login may lack cloud product info.
+                self._readable_name_cache.clear()
                 return await self.async_step_device()
 
         if user_input is None:
             user_input = {}
-            if self._discovery_info:
+            if self._discovery_info and not self._creds_prefetched:
                 await self._manager.get_device_credentials(
                     self._discovery_info.address,
                     False,
@@ -288,7 +337,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             address = user_input[CONF_ADDRESS]
             discovery_info = self._discovered_devices[address]
-            local_name = await get_device_readable_name(discovery_info, self._manager)
+            local_name = await self._async_get_readable_name(discovery_info)
             await self.async_set_unique_id(
                 discovery_info.address, raise_on_progress=False
             )
@@ -316,7 +365,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                     discovery.address in current_addresses
                     or discovery.address in self._discovered_devices
                     or discovery.service_data is None
-                    or not SERVICE_UUID in discovery.service_data.keys()
+                    or SERVICE_UUID not in discovery.service_data
                 ):
                     continue
                 self._discovered_devices[discovery.address] = discovery
@@ -330,6 +379,14 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         else:
             def_address = list(self._discovered_devices)[0]
 
+        service_infos = list(self._discovered_devices.values())
+        names = await asyncio.gather(
+            *(
+                self._async_get_readable_name(service_info)
+                for service_info in service_infos
+            )
+        )
+
         return self.async_show_form(
             step_id="device",
             data_schema=vol.Schema(
@@ -339,11 +396,8 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                         default=def_address,
                     ): vol.In(
                         {
-                            service_info.address: await get_device_readable_name(
-                                service_info,
-                                self._manager,
-                            )
-                            for service_info in self._discovered_devices.values()
+                            service_info.address: name
+                            for service_info, name in zip(service_infos, names)
                         }
                     ),
                 },
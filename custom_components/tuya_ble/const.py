@@ -10,6 +10,7 @@ DEVICE_METADATA_UUIDS: Final = "uuids"
 
 DEVICE_DEF_MANUFACTURER: Final = "Tuya"
 SET_DISCONNECTED_DELAY = 10 * 60
+BLE_UPDATE_COOLDOWN = 0.25
 
 CONF_UUID: Final = "uuid"
 CONF_LOCAL_KEY: Final = "local_key"
@@ -19,9 +20,18 @@ CONF_DEVICE_NAME: Final = "device_name"
 CONF_PRODUCT_MODEL: Final = "product_model"
 CONF_PRODUCT_NAME: Final = "product_name"
 
+CLOUD_CACHE_STORAGE_KEY: Final = "tuya_ble_credentials"
+CLOUD_CACHE_STORAGE_VERSION: Final = 1
+CLOUD_CACHE_SAVE_DELAY: Final = 10
+
+LOGIN_ATTEMPTS: Final = 3
+LOGIN_RETRY_DELAY: Final = 0.5
+LOGIN_TIMEOUT: Final = 15
+
 TUYA_API_DEVICES_URL: Final = "/v1.0/users/%s/devices"
 TUYA_API_FACTORY_INFO_URL: Final = "/v1.0/iot-03/devices/factory-infos?device_ids=%s"
 TUYA_FACTORY_INFO_MAC: Final = "mac"
+TUYA_FACTORY_INFO_MAX_REQUESTS: Final = 8
 
 BATTERY_STATE_LOW: Final = "low"
 BATTERY_STATE_NORMAL: Final = "normal"
@@ -1,8 +1,12 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 
+import functools
 import logging
+from types import MappingProxyType
+from typing import Any, Protocol, TypeVar
 from homeassistant.const import CONF_ADDRESS, CONF_DEVICE_ID
 
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
@@ -36,8 +40,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_MappingT = TypeVar("_MappingT", covariant=True)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TuyaBLEFingerbotInfo:
     switch: int
     mode: int
@@ -49,7 +55,7 @@ class TuyaBLEFingerbotInfo:
     program: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEProductInfo:
     name: str
     manufacturer: str = DEVICE_DEF_MANUFACTURER
@@ -76,7 +82,7 @@ class TuyaBLEEntity(CoordinatorEntity):
             self._attr_translation_key = description.key
         self.entity_description = description
         self._attr_has_entity_name = True
-        self._attr_device_info = get_device_info(self._device)
+        self._attr_device_info = coordinator.device_info
         self._attr_unique_id = f"{self._device.device_id}-{description.key}"
         self.entity_id = generate_entity_id(
             "sensor.{}", self._attr_unique_id, hass=hass
@@ -106,6 +112,11 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
         self._device = device
         self._disconnected: bool = True
         self._unsub_disconnect: CALLBACK_TYPE | None = None
+        # Only fingerbots with manual control fire button events.
+        self._fingerbot_switch: int | None = None
+        info = get_device_product_info(device)
+        if info and info.fingerbot and info.fingerbot.manual_control != 0:
+            self._fingerbot_switch = info.fingerbot.switch
         device.register_connected_callback(self._async_handle_connect)
         device.register_callback(self._async_handle_update)
         device.register_disconnected_callback(self._async_handle_disconnect)
@@ -114,10 +125,18 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
     def connected(self) -> bool:
         return not self._disconnected
 
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the DeviceInfo shared by all entities of the device."""
+        return get_device_info(self._device)
+
     @callback
     def _async_handle_connect(self) -> None:
+        if not self._disconnected and self._unsub_disconnect is None:
+            return
         if self._unsub_disconnect is not None:
             self._unsub_disconnect()
+            self._unsub_disconnect = None
         if self._disconnected:
             self._disconnected = False
             self.async_update_listeners()
@@ -127,10 +146,9 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
         """Just trigger the callbacks."""
         self._async_handle_connect()
         self.async_set_updated_data(None)
-        info = get_device_product_info(self._device)
-        if info and info.fingerbot and info.fingerbot.manual_control != 0:
+        if self._fingerbot_switch is not None:
             for update in updates:
-                if update.id == info.fingerbot.switch and update.changed_by_device:
+                if update.id == self._fingerbot_switch and update.changed_by_device:
                     self.hass.bus.fire(
                         FINGERBOT_BUTTON_EVENT,
                         {
@@ -156,7 +174,7 @@ class TuyaBLECoordinator(DataUpdateCoordinator[None]):
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaBLEData:
     """Data for the Tuya BLE integration."""
 
@@ -167,12 +185,48 @@ class TuyaBLEData:
     coordinator: TuyaBLECoordinator
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryInfo:
     products: dict[str, TuyaBLEProductInfo]
     info: TuyaBLEProductInfo | None = None
 
 
+def _fanout(
+    product_ids: Iterable[str], info: TuyaBLEProductInfo
+) -> dict[str, TuyaBLEProductInfo]:
+    """Map several product ids to one shared product info."""
+    return dict.fromkeys(product_ids, info)
+
+
+_CUBETOUCH_INFO = TuyaBLEFingerbotInfo(
+    switch=1,
+    mode=2,
+    up_position=5,
+    down_position=6,
+    hold_time=3,
+    reverse_positions=4,
+)
+_FINGERBOT_PLUS_INFO = TuyaBLEFingerbotInfo(
+    switch=2,
+    mode=8,
+    up_position=15,
+    down_position=9,
+    hold_time=10,
+    reverse_positions=11,
+    manual_control=17,
+    program=121,
+)
+_FINGERBOT_INFO = TuyaBLEFingerbotInfo(
+    switch=2,
+    mode=8,
+    up_position=15,
+    down_position=9,
+    hold_time=10,
+    reverse_positions=11,
+    program=121,
+)
+
+
 devices_database: dict[str, TuyaBLECategoryInfo] = {
     "co2bj": TuyaBLECategoryInfo(
         products={
@@ -183,7 +237,7 @@ devices_database: dict[str, TuyaBLECategoryInfo] = {
     ),
     "ms": TuyaBLECategoryInfo(
         products={
-            **dict.fromkeys(
+            **_fanout(
                 [
                     "ludzroix",
                     "isk2p555"
@@ -198,27 +252,13 @@ devices_database: dict[str, TuyaBLECategoryInfo] = {
         products={
             "3yqdo5yt": TuyaBLEProductInfo(  # device product_id
                 name="CUBETOUCH 1s",
-                fingerbot=TuyaBLEFingerbotInfo(
-                    switch=1,
-                    mode=2,
-                    up_position=5,
-                    down_position=6,
-                    hold_time=3,
-                    reverse_positions=4,
-                ),
+                fingerbot=_CUBETOUCH_INFO,
             ),
             "xhf790if": TuyaBLEProductInfo(  # device product_id
                 name="CubeTouch II",
-                fingerbot=TuyaBLEFingerbotInfo(
-                    switch=1,
-                    mode=2,
-                    up_position=5,
-                    down_position=6,
-                    hold_time=3,
-                    reverse_positions=4,
-                ),
+                fingerbot=_CUBETOUCH_INFO,
             ),
-            **dict.fromkeys(
+            **_fanout(
                 [
                     "blliqpsj",
                     "ndvkgsrm",
@@ -227,19 +267,10 @@ devices_database: dict[str, TuyaBLECategoryInfo] = {
                 ],  # device product_ids
                 TuyaBLEProductInfo(
                     name="Fingerbot Plus",
-                    fingerbot=TuyaBLEFingerbotInfo(
-                        switch=2,
-                        mode=8,
-                        up_position=15,
-                        down_position=9,
-                        hold_time=10,
-                        reverse_positions=11,
-                        manual_control=17,
-                        program=121,
-                    ),
+                    fingerbot=_FINGERBOT_PLUS_INFO,
                 ),
             ),
-            **dict.fromkeys(
+            **_fanout(
                 [
                     "ltak7e1p",
                     "y6kttvd6",
@@ -251,22 +282,14 @@ devices_database: dict[str, TuyaBLECategoryInfo] = {
                 ],  # device product_ids
                 TuyaBLEProductInfo(
                     name="Fingerbot",
-                    fingerbot=TuyaBLEFingerbotInfo(
-                        switch=2,
-                        mode=8,
-                        up_position=15,
-                        down_position=9,
-                        hold_time=10,
-                        reverse_positions=11,
-                        program=121,
-                    ),
+                    fingerbot=_FINGERBOT_INFO,
                 ),
             ),
         },
     ),
     "wk": TuyaBLECategoryInfo(
         products={
-            **dict.fromkeys(
+            **_fanout(
             [
             "drlajpqc", 
             "nhj2j7su",
@@ -303,26 +326,83 @@ devices_database: dict[str, TuyaBLECategoryInfo] = {
 }
 
 
+_PRODUCT_INDEX: dict[tuple[str, str], TuyaBLEProductInfo] = {
+    (category, product_id): product_info
+    for category, category_info in devices_database.items()
+    for product_id, product_info in category_info.products.items()
+}
+_CATEGORY_DEFAULT: dict[str, TuyaBLEProductInfo] = {
+    category: category_info.info
+    for category, category_info in devices_database.items()
+    if category_info.info is not None
+}
+
+
 def get_product_info_by_ids(
     category: str, product_id: str
 ) -> TuyaBLEProductInfo | None:
-    category_info = devices_database.get(category)
-    if category_info is not None:
-        product_info = category_info.products.get(product_id)
-        if product_info is not None:
-            return product_info
-        return category_info.info
-    else:
-        return None
+    return _PRODUCT_INDEX.get((category, product_id)) or _CATEGORY_DEFAULT.get(
+        category
+    )
 
 
 def get_device_product_info(device: TuyaBLEDevice) -> TuyaBLEProductInfo | None:
     return get_product_info_by_ids(device.category, device.product_id)
 
 
+class TuyaBLECategoryMapping(Protocol[_MappingT]):
+    """Mappings of a device category in a platform mapping table."""
+
+    @property
+    def products(self) -> Mapping[str, tuple[_MappingT, ...]] | None:
+        ...
+
+    @property
+    def mapping(self) -> tuple[_MappingT, ...] | None:
+        ...
+
+
+def build_mapping_lookup(
+    mapping: Mapping[str, TuyaBLECategoryMapping[_MappingT]],
+) -> Callable[[TuyaBLEDevice], tuple[_MappingT, ...]]:
+    """Build the device lookup of a platform mapping table.
+
+    A device gets the mappings of its product, or the category-wide
+    mappings when its product has none. Unlike the former per-platform
+    lookups, an empty product entry also falls back to the category.
+    """
+    product_index: Mapping[tuple[str, str], tuple[_MappingT, ...]] = (
+        MappingProxyType(
+            {
+                (category_id, product_id): product_mapping
+                for category_id, category in mapping.items()
+                if category.products
+                for product_id, product_mapping in category.products.items()
+            }
+        )
+    )
+    category_fallback: Mapping[str, tuple[_MappingT, ...]] = MappingProxyType(
+        {
+            category_id: category.mapping
+            for category_id, category in mapping.items()
+            if category.mapping
+        }
+    )
+
+    def get_mapping_by_device(device: TuyaBLEDevice) -> tuple[_MappingT, ...]:
+        return product_index.get(
+            (device.category, device.product_id)
+        ) or category_fallback.get(device.category, ())
+
+    return get_mapping_by_device
+
+
+_ADDRESS_SEPARATORS = str.maketrans("", "", "-:")
+
+
+@functools.lru_cache(maxsize=None)
 def get_short_address(address: str) -> str:
-    results = address.replace("-", ":").upper().split(":")
-    return f"{results[-3]}{results[-2]}{results[-1]}"[-6:]
+    return address.translate(_ADDRESS_SEPARATORS)[-6:].upper()
 
 
 async def get_device_readable_name(
@@ -340,42 +420,53 @@ async def get_device_readable_name(
             )
     short_address = get_short_address(discovery_info.address)
     if product_info:
-        return "%s %s" % (product_info.name, short_address)
+        return f"{product_info.name} {short_address}"
     if credentials:
-        return "%s %s" % (credentials.device_name, short_address)
-    return "%s %s" % (discovery_info.device.name, short_address)
+        return f"{credentials.device_name} {short_address}"
+    return f"{discovery_info.device.name} {short_address}"
 
 
 def get_device_info(device: TuyaBLEDevice) -> DeviceInfo | None:
+    # All entities of a device share one DeviceInfo while its details stay the same.
+    return _get_device_info(
+        device.address,
+        device.name,
+        device.category,
+        device.product_id,
+        device.product_model,
+        device.hardware_version,
+        device.device_version,
+        device.protocol_version,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _get_device_info(
+    address: str,
+    name: str,
+    category: str,
+    product_id: str,
+    product_model: str,
+    hardware_version: str,
+    device_version: str,
+    protocol_version: str,
+) -> DeviceInfo:
     product_info = None
-    if device.category and device.product_id:
-        product_info = get_product_info_by_ids(device.category, device.product_id)
+    if category and product_id:
+        product_info = get_product_info_by_ids(category, product_id)
     product_name: str
     if product_info:
         product_name = product_info.name
     else:
-        product_name = device.name
-    result = DeviceInfo(
-        connections={(dr.CONNECTION_BLUETOOTH, device.address)},
-        hw_version=device.hardware_version,
-        identifiers={(DOMAIN, device.address)},
+        product_name = name
+    return DeviceInfo(
+        connections={(dr.CONNECTION_BLUETOOTH, address)},
+        hw_version=hardware_version,
+        identifiers={(DOMAIN, address)},
         manufacturer=(
             product_info.manufacturer if product_info else DEVICE_DEF_MANUFACTURER
         ),
-        model=("%s (%s)")
-        % (
-            device.product_model or product_name,
-            device.product_id,
-        ),
-        name=("%s %s")
-        % (
-            product_name,
-            get_short_address(device.address),
-        ),
-        sw_version=("%s (protocol %s)")
-        % (
-            device.device_version,
-            device.protocol_version,
-        ),
+        model=f"{product_model or product_name} ({product_id})",
+        name=f"{product_name} {get_short_address(address)}",
+        sw_version=f"{device_version} (protocol {protocol_version})",
     )
-    return result
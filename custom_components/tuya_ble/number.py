@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 import logging
+from types import MappingProxyType
 from typing import Any, Callable
 
 from homeassistant.components.number import (
@@ -27,7 +29,12 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +54,7 @@ TuyaBLENumberSetter = (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLENumberMapping:
     dp_id: int
     description: NumberEntityDescription
@@ -202,7 +209,7 @@ class TuyaBLEHoldTimeDescription(NumberEntityDescription):
     entity_category: EntityCategory = EntityCategory.CONFIG
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEHoldTimeMapping(TuyaBLENumberMapping):
     description: NumberEntityDescription = field(
         default_factory=lambda: TuyaBLEHoldTimeDescription()
@@ -210,16 +217,16 @@ class TuyaBLEHoldTimeMapping(TuyaBLENumberMapping):
     is_available: TuyaBLENumberIsAvailable = is_fingerbot_in_push_mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryNumberMapping:
-    products: dict[str, list[TuyaBLENumberMapping]] | None = None
-    mapping: list[TuyaBLENumberMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLENumberMapping, ...]] | None = None
+    mapping: tuple[TuyaBLENumberMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryNumberMapping] = {
+mapping: Mapping[str, TuyaBLECategoryNumberMapping] = MappingProxyType({
     "co2bj": TuyaBLECategoryNumberMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
+        products=MappingProxyType({
+            "59s19z5m": (  # CO2 Detector
                 TuyaBLENumberMapping(
                     dp_id=17,
                     description=NumberEntityDescription(
@@ -245,14 +252,14 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "szjqr": TuyaBLECategoryNumberMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+                (
                     TuyaBLEHoldTimeMapping(dp_id=3),
                     TuyaBLENumberMapping(
                         dp_id=5,
@@ -266,7 +273,7 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                             native_min_value=0,
                         ),
                     ),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -275,7 +282,7 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                     "yiihr7zh",
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLENumberMapping(
                         dp_id=9,
                         description=TuyaBLEDownPositionDescription(),
@@ -316,7 +323,7 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         getter=get_fingerbot_program_position,
                         setter=set_fingerbot_program_position,
                     ),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -328,7 +335,7 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                     "rvdceqjh",
                     "5xhbk964",
                 ],  # Fingerbot
-                [
+                (
                     TuyaBLENumberMapping(
                         dp_id=9,
                         description=TuyaBLEDownPositionDescription(),
@@ -347,18 +354,18 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         description=TuyaBLEUpPositionDescription(),
                         is_available=is_fingerbot_not_in_program_mode,
                     ),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wk": TuyaBLECategoryNumberMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 [
                     "drlajpqc",
                     "nhj2j7su",
                 ],  # Thermostatic Radiator Valve
-                [
+                (
                     TuyaBLENumberMapping(
                         dp_id=27,
                         description=NumberEntityDescription(
@@ -371,13 +378,13 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wsdcg": TuyaBLECategoryNumberMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
+        products=MappingProxyType({
+            "ojzlzzsw": (  # Soil moisture sensor
                 TuyaBLENumberMapping(
                     dp_id=17,
                     description=NumberEntityDescription(
@@ -390,13 +397,13 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "znhsb": TuyaBLECategoryNumberMapping(
-        products={
+        products=MappingProxyType({
             "cdlandip":  # Smart water bottle
-            [
+            (
                 TuyaBLENumberMapping(
                     dp_id=103,
                     description=NumberEntityDescription(
@@ -409,12 +416,12 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "ggq": TuyaBLECategoryNumberMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer
+        products=MappingProxyType({
+            "6pahkcau": (  # Irrigation computer
                 TuyaBLENumberMapping(
                     dp_id=5,
                     description=NumberEntityDescription(
@@ -426,24 +433,15 @@ mapping: dict[str, TuyaBLECategoryNumberMapping] = {
                         native_step=1,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
-}
-
-
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategoryNumberMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+})
+
+
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLENumberMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLENumber(TuyaBLEEntity, NumberEntity):
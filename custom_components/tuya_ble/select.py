@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping, Callable
 from dataclasses import dataclass, field
 
 import logging
+from types import MappingProxyType
 
 from homeassistant.components.select import (
     SelectEntityDescription,
@@ -22,13 +24,18 @@ from .const import (
     FINGERBOT_MODE_PUSH,
     FINGERBOT_MODE_SWITCH,
 )
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLESelectMapping:
     dp_id: int
     description: SelectEntityDescription
@@ -43,7 +50,7 @@ class TemperatureUnitDescription(SelectEntityDescription):
     entity_category: EntityCategory = EntityCategory.CONFIG
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEFingerbotModeMapping(TuyaBLESelectMapping):
     description: SelectEntityDescription = field(
         default_factory=lambda: SelectEntityDescription(
@@ -59,17 +66,17 @@ class TuyaBLEFingerbotModeMapping(TuyaBLESelectMapping):
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategorySelectMapping:
-    products: dict[str, list[TuyaBLESelectMapping]] | None = None
-    mapping: list[TuyaBLESelectMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLESelectMapping, ...]] | None = None
+    mapping: tuple[TuyaBLESelectMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySelectMapping] = {
+mapping: Mapping[str, TuyaBLECategorySelectMapping] = MappingProxyType({
     "co2bj": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             "59s19z5m":  # CO2 Detector
-            [
+            (
                 TuyaBLESelectMapping(
                     dp_id=101,
                     description=TemperatureUnitDescription(
@@ -79,14 +86,14 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                         ],
                     )
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "ms": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["ludzroix", "isk2p555"], # Smart Lock
-                [
+                (
                     TuyaBLESelectMapping(
                         dp_id=31,
                         description=SelectEntityDescription(
@@ -100,17 +107,17 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
-                ]
+                )
             ),
-        }
+        })
     ),
     "szjqr": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -119,24 +126,24 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                     "yiihr7zh", 
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=8),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 ["ltak7e1p", "y6kttvd6", "yrnk7mnn",
                     "nvr2rocq", "bnt7wajf", "rvdceqjh",
                     "5xhbk964"],  # Fingerbot
-                [
+                (
                     TuyaBLEFingerbotModeMapping(dp_id=8),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wsdcg": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             "ojzlzzsw":  # Soil moisture sensor
-            [
+            (
                 TuyaBLESelectMapping(
                     dp_id=9,
                     description=TemperatureUnitDescription(
@@ -147,13 +154,13 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                         entity_registry_enabled_default=False,
                     )
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "znhsb": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             "cdlandip":  # Smart water bottle
-            [
+            (
                 TuyaBLESelectMapping(
                     dp_id=106,
                     description=TemperatureUnitDescription(
@@ -174,13 +181,13 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "znhsb": TuyaBLECategorySelectMapping(
-        products={
+        products=MappingProxyType({
             "cdlandip":  # Smart water bottle
-            [
+            (
                 TuyaBLESelectMapping(
                     dp_id=106,
                     description=TemperatureUnitDescription(
@@ -201,26 +208,15 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
-}
+})
 
 
-def get_mapping_by_device(
-    device: TuyaBLEDevice
-) -> list[TuyaBLECategorySelectMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLESelectMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLESelect(TuyaBLEEntity, SelectEntity):
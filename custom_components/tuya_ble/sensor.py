@@ -1,10 +1,12 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 import logging
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -38,7 +40,12 @@ from .const import (
     CO2_LEVEL_NORMAL,
     DOMAIN,
 )
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,7 +56,7 @@ SIGNAL_STRENGTH_DP_ID = -1
 TuyaBLESensorIsAvailable = Callable[["TuyaBLESensor", TuyaBLEProductInfo], bool] | None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLESensorMapping:
     dp_id: int
     description: SensorEntityDescription
@@ -61,7 +68,7 @@ class TuyaBLESensorMapping:
     is_available: TuyaBLESensorIsAvailable = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEBatteryMapping(TuyaBLESensorMapping):
     description: SensorEntityDescription = field(
         default_factory=lambda: SensorEntityDescription(
@@ -74,7 +81,7 @@ class TuyaBLEBatteryMapping(TuyaBLESensorMapping):
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLETemperatureMapping(TuyaBLESensorMapping):
     description: SensorEntityDescription = field(
         default_factory=lambda: SensorEntityDescription(
@@ -100,16 +107,16 @@ def battery_enum_getter(self: TuyaBLESensor) -> None:
         self._attr_native_value = datapoint.value * 20.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategorySensorMapping:
-    products: dict[str, list[TuyaBLESensorMapping]] | None = None
-    mapping: list[TuyaBLESensorMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLESensorMapping, ...]] | None = None
+    mapping: tuple[TuyaBLESensorMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySensorMapping] = {
+mapping: Mapping[str, TuyaBLECategorySensorMapping] = MappingProxyType({
     "co2bj": TuyaBLECategorySensorMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
+        products=MappingProxyType({
+            "59s19z5m": (  # CO2 Detector
                 TuyaBLESensorMapping(
                     dp_id=1,
                     description=SensorEntityDescription(
@@ -143,14 +150,14 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                         state_class=SensorStateClass.MEASUREMENT,
                     ),
                 ),
-            ]
-        }
+            )
+        })
     ),
     "ms": TuyaBLECategorySensorMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["ludzroix", "isk2p555"], # Smart Lock
-                [
+                (
                     TuyaBLESensorMapping(
                         dp_id=21,
                         description=SensorEntityDescription(
@@ -164,15 +171,15 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                         ),
                     ),
                     TuyaBLEBatteryMapping(dp_id=8),
-                ],
+                ),
             ),
-        }
+        })
     ),
     "szjqr": TuyaBLECategorySensorMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+                (
                     TuyaBLESensorMapping(
                         dp_id=7,
                         description=SensorEntityDescription(
@@ -192,7 +199,7 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                         ],
                     ),
                     TuyaBLEBatteryMapping(dp_id=8),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -201,9 +208,9 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                     "yiihr7zh", 
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLEBatteryMapping(dp_id=12),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -215,15 +222,15 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                     "rvdceqjh",
                     "5xhbk964",
                 ],  # Fingerbot
-                [
+                (
                     TuyaBLEBatteryMapping(dp_id=12),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wsdcg": TuyaBLECategorySensorMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
+        products=MappingProxyType({
+            "ojzlzzsw": (  # Soil moisture sensor
                 TuyaBLETemperatureMapping(
                     dp_id=1,
                     coefficient=10.0,
@@ -257,13 +264,13 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                     ],
                 ),
                 TuyaBLEBatteryMapping(dp_id=4),
-            ],
-        },
+            ),
+        }),
     ),
     "znhsb": TuyaBLECategorySensorMapping(
-        products={
+        products=MappingProxyType({
             "cdlandip":  # Smart water bottle
-            [
+            (
                 TuyaBLETemperatureMapping(
                     dp_id=101,
                 ),
@@ -287,12 +294,12 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                     ),
                     getter=battery_enum_getter,
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "ggq": TuyaBLECategorySensorMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer
+        products=MappingProxyType({
+            "6pahkcau": (  # Irrigation computer
                 TuyaBLEBatteryMapping(dp_id=11),
                 TuyaBLESensorMapping(
                     dp_id=6,
@@ -303,10 +310,10 @@ mapping: dict[str, TuyaBLECategorySensorMapping] = {
                         state_class=SensorStateClass.MEASUREMENT,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
-}
+})
 
 
 def rssi_getter(sensor: TuyaBLESensor) -> None:
@@ -327,18 +334,9 @@ rssi_mapping = TuyaBLESensorMapping(
 )
 
 
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLESensorMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLESensorMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLESensor(TuyaBLEEntity, SensorEntity):
@@ -354,6 +352,7 @@ class TuyaBLESensor(TuyaBLEEntity, SensorEntity):
     ) -> None:
         super().__init__(hass, coordinator, device, product, mapping.description)
         self._mapping = mapping
+        self._last_raw: tuple[bool, Any] | None = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -362,6 +361,10 @@ class TuyaBLESensor(TuyaBLEEntity, SensorEntity):
             self._mapping.getter(self)
         else:
             datapoint = self._device.datapoints[self._mapping.dp_id]
+            raw = (self.available, datapoint.value if datapoint else None)
+            if raw == self._last_raw:
+                return
+            self._last_raw = raw
             if datapoint:
                 if datapoint.type == TuyaBLEDataPointType.DT_ENUM:
                     if self.entity_description.options is not None:
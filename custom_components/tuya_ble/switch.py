@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
 import logging
+from types import MappingProxyType
 from typing import Any, Callable
 
 from homeassistant.components.switch import (
@@ -17,7 +19,12 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,7 +45,7 @@ TuyaBLESwitchSetter = (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLESwitchMapping:
     dp_id: int
     description: SwitchEntityDescription
@@ -97,7 +104,7 @@ def set_fingerbot_program_repeat_forever(
             self._hass.create_task(datapoint.set_value(new_value))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEFingerbotSwitchMapping(TuyaBLESwitchMapping):
     description: SwitchEntityDescription = field(
         default_factory=lambda: SwitchEntityDescription(
@@ -107,7 +114,7 @@ class TuyaBLEFingerbotSwitchMapping(TuyaBLESwitchMapping):
     is_available: TuyaBLESwitchIsAvailable = is_fingerbot_in_switch_mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLEReversePositionsMapping(TuyaBLESwitchMapping):
     description: SwitchEntityDescription = field(
         default_factory=lambda: SwitchEntityDescription(
@@ -119,16 +126,16 @@ class TuyaBLEReversePositionsMapping(TuyaBLESwitchMapping):
     is_available: TuyaBLESwitchIsAvailable = is_fingerbot_in_switch_mode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategorySwitchMapping:
-    products: dict[str, list[TuyaBLESwitchMapping]] | None = None
-    mapping: list[TuyaBLESwitchMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLESwitchMapping, ...]] | None = None
+    mapping: tuple[TuyaBLESwitchMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySwitchMapping] = {
+mapping: Mapping[str, TuyaBLECategorySwitchMapping] = MappingProxyType({
     "co2bj": TuyaBLECategorySwitchMapping(
-        products={
-            "59s19z5m": [  # CO2 Detector
+        products=MappingProxyType({
+            "59s19z5m": (  # CO2 Detector
                 TuyaBLESwitchMapping(
                     dp_id=11,
                     description=SwitchEntityDescription(
@@ -157,32 +164,32 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                         entity_category=EntityCategory.CONFIG,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "ms": TuyaBLECategorySwitchMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["ludzroix", "isk2p555"], # Smart Lock
-                [
+                (
                     TuyaBLESwitchMapping(
                         dp_id=47,
                         description=SwitchEntityDescription(
                             key="lock_motor_state",
                         ),
                     ),
-                ]
+                )
             ),
-        }
+        })
     ),
     "szjqr": TuyaBLECategorySwitchMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+                (
                     TuyaBLEFingerbotSwitchMapping(dp_id=1),
                     TuyaBLEReversePositionsMapping(dp_id=4),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -191,7 +198,7 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                     "yiihr7zh",
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLEFingerbotSwitchMapping(dp_id=2),
                     TuyaBLEReversePositionsMapping(dp_id=11),
                     TuyaBLESwitchMapping(
@@ -221,7 +228,7 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                         is_available=is_fingerbot_in_program_mode,
                         setter=set_fingerbot_program_repeat_forever,
                     ),
-                ],
+                ),
             ),
             **dict.fromkeys(
                 [
@@ -233,21 +240,21 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                     "rvdceqjh",
                     "5xhbk964",
                 ],  # Fingerbot
-                [
+                (
                     TuyaBLEFingerbotSwitchMapping(dp_id=2),
                     TuyaBLEReversePositionsMapping(dp_id=11),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wk": TuyaBLECategorySwitchMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 [
                     "drlajpqc",
                     "nhj2j7su",
                 ],  # Thermostatic Radiator Valve
-                [
+                (
                     TuyaBLESwitchMapping(
                         dp_id=8,
                         description=SwitchEntityDescription(
@@ -296,13 +303,13 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                             entity_category=EntityCategory.CONFIG,
                         ),
                     ),
-                ],
+                ),
             ),
-        },
+        }),
     ),
     "wsdcg": TuyaBLECategorySwitchMapping(
-        products={
-            "ojzlzzsw": [  # Soil moisture sensor
+        products=MappingProxyType({
+            "ojzlzzsw": (  # Soil moisture sensor
                 TuyaBLESwitchMapping(
                     dp_id=21,
                     description=SwitchEntityDescription(
@@ -312,12 +319,12 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                         entity_registry_enabled_default=False,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
     "ggq": TuyaBLECategorySwitchMapping(
-        products={
-            "6pahkcau": [  # Irrigation computer
+        products=MappingProxyType({
+            "6pahkcau": (  # Irrigation computer
                 TuyaBLESwitchMapping(
                     dp_id=1,
                     description=SwitchEntityDescription(
@@ -325,24 +332,15 @@ mapping: dict[str, TuyaBLECategorySwitchMapping] = {
                         entity_registry_enabled_default=True,
                     ),
                 ),
-            ],
-        },
+            ),
+        }),
     ),
-}
+})
 
 
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLECategorySwitchMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLESwitchMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLESwitch(TuyaBLEEntity, SwitchEntity):
@@ -1,9 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 import logging
+from types import MappingProxyType
 from struct import pack, unpack
 from typing import Callable
 
@@ -20,7 +22,12 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .const import (
     DOMAIN,
 )
-from .devices import TuyaBLEData, TuyaBLEEntity, TuyaBLEProductInfo
+from .devices import (
+    TuyaBLEData,
+    TuyaBLEEntity,
+    TuyaBLEProductInfo,
+    build_mapping_lookup,
+)
 from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -97,7 +104,7 @@ def set_fingerbot_program(
             self._hass.create_task(datapoint.set_value(new_value))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLETextMapping:
     dp_id: int
     description: TextEntityDescription
@@ -109,15 +116,15 @@ class TuyaBLETextMapping:
     setter: Callable[[TuyaBLEText], None] | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TuyaBLECategoryTextMapping:
-    products: dict[str, list[TuyaBLETextMapping]] | None = None
-    mapping: list[TuyaBLETextMapping] | None = None
+    products: Mapping[str, tuple[TuyaBLETextMapping, ...]] | None = None
+    mapping: tuple[TuyaBLETextMapping, ...] | None = None
 
 
-mapping: dict[str, TuyaBLECategoryTextMapping] = {
+mapping: Mapping[str, TuyaBLECategoryTextMapping] = MappingProxyType({
     "szjqr": TuyaBLECategoryTextMapping(
-        products={
+        products=MappingProxyType({
             **dict.fromkeys(
                 [
                     "blliqpsj",
@@ -125,7 +132,7 @@ mapping: dict[str, TuyaBLECategoryTextMapping] = {
                     "yiihr7zh",
                     "neq16kgd"
                 ],  # Fingerbot Plus
-                [
+                (
                     TuyaBLETextMapping(
                         dp_id=121,
                         description=TextEntityDescription(
@@ -138,25 +145,16 @@ mapping: dict[str, TuyaBLECategoryTextMapping] = {
                         getter=get_fingerbot_program,
                         setter=set_fingerbot_program,
                     ),
-                ]
+                )
             ),
-        },
+        }),
     ),
-}
-
-
-def get_mapping_by_device(device: TuyaBLEDevice) -> list[TuyaBLETextMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+})
+
+
+get_mapping_by_device: Callable[
+    [TuyaBLEDevice], tuple[TuyaBLETextMapping, ...]
+] = build_mapping_lookup(mapping)
 
 
 class TuyaBLEText(TuyaBLEEntity, TextEntity):
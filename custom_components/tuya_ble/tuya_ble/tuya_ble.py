@@ -1003,11 +1003,12 @@ class TuyaBLEDevice:
             case _:
                 raise TuyaBLEDataFormatError()
 
-        _LOGGER.debug(
-            "%s: Received timestamp: %s",
-            self.address,
-            time.ctime(timestamp),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Received timestamp: %s",
+                self.address,
+                time.ctime(timestamp),
+            )
         return (timestamp, end_pos)
 
     def _parse_datapoints_v3(
@@ -1206,14 +1207,15 @@ class TuyaBLEDevice:
         try:
             code = TuyaBLECode(_code)
         except ValueError:
-            _LOGGER.debug(
-                "%s: Received unknown message: #%s %x, response to #%s, data %s",
-                self.address,
-                seq_num,
-                _code,
-                response_to,
-                data.hex(),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Received unknown message: #%s %x, response to #%s, data %s",
+                    self.address,
+                    seq_num,
+                    _code,
+                    response_to,
+                    data.hex(),
+                )
             return
 
         if response_to != 0:
@@ -1236,7 +1238,8 @@ class TuyaBLEDevice:
 
     def _notification_handler(self, _sender: int, data: bytearray) -> None:
         """Handle notification responses."""
-        _LOGGER.debug("%s: Packet received: %s", self.address, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Packet received: %s", self.address, data.hex())
 
         pos: int = 0
         packet_num: int